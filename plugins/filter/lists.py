@@ -19,11 +19,10 @@ class FilterModule(object):
         """
         """
         # display.v(f"valid_list(self, {data}, {valid_entries})")
-        result = []
-        if isinstance(data, list):
-            data.sort()
-            valid_entries.sort()
-            result = list(set(data).intersection(valid_entries))
-            result.sort()
-        # display.v(f"=result: {result}")
-        return result
+        if not isinstance(data, list):
+            return []
+
+        if isinstance(valid_entries, (set, frozenset)):
+            return sorted(valid_entries.intersection(data))
+
+        return sorted(set(data).intersection(valid_entries))
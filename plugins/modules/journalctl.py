@@ -7,6 +7,8 @@
 
 from __future__ import absolute_import, division, print_function
 
+import shlex
+
 from ansible.module_utils.basic import AnsibleModule
 
 DOCUMENTATION = """
@@ -103,7 +105,7 @@ class JournalCtl(object):
         self.identifier = module.params.get("identifier")
         self.lines = module.params.get("lines")
         self.reverse = module.params.get("reverse")
-        self.arguments = module.params.get("arguments")
+        self.arguments = tuple(module.params.get("arguments") or ())
 
         # module.log(msg="----------------------------")
         # module.log(msg=f" journalctl   : {self._journalctl}")
@@ -134,33 +136,27 @@ class JournalCtl(object):
 
             Query the journal.
         """
-        args = []
-        args.append(self._journalctl)
+        args = [self._journalctl]
 
         if self.unit:
-            args.append("--unit")
-            args.append(self.unit)
+            args += ["--unit", self.unit]
 
         if self.identifier:
-            args.append("--identifier")
-            args.append(self.identifier)
+            args += ["--identifier", self.identifier]
 
         if self.lines:
-            args.append("--lines")
-            args.append(str(self.lines))
+            args += ["--lines", str(self.lines)]
 
         if self.reverse:
             args.append("--reverse")
 
-        if len(self.arguments) > 0:
-            for arg in self.arguments:
-                args.append(arg)
+        args.extend(self.arguments)
 
         rc, out, err = self._exec(args)
 
         return dict(
             rc=rc,
-            cmd=" ".join(args),
+            cmd=" ".join(shlex.quote(arg) for arg in args),
             stdout=out,
             stderr=err,
         )
@@ -214,7 +210,7 @@ def main():
     k = JournalCtl(module)
     result = k.run()
 
-    module.log(msg=f"= result: {result}")
+    # module.log(msg=f"= result: {result}")
 
     module.exit_json(**result)
 